@@ -1,25 +1,85 @@
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from enum import Enum
-import random
-from typing import List, Dict, Optional
+from datetime import datetime
+from enum import IntEnum
+import multiprocessing
+from typing import List, Dict, Optional, Union
 import matplotlib.pyplot as plt
+import numpy as np
 
-class TaskStatus(Enum):
-    IN_PROGRESS = "in_progress"
-    READY_TO_DEPLOY = "ready_to_deploy"
-    DEPLOYED = "deployed"
-    FAILED = "failed"
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels also run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
-@dataclass
-class Task:
-    id: int
-    created_date: datetime
-    complexity: int
-    status: TaskStatus
-    deploy_date: Optional[datetime] = None
-    recovery_hours: float = 0
-    dependencies: List[str] = None
+class TaskStatus(IntEnum):
+    IN_PROGRESS = 0
+    READY_TO_DEPLOY = 1
+    DEPLOYED = 2
+    FAILED = 3
+
+# int8 status codes stored in the simulation's task arrays
+IN_PROGRESS = np.int8(TaskStatus.IN_PROGRESS)
+READY_TO_DEPLOY = np.int8(TaskStatus.READY_TO_DEPLOY)
+DEPLOYED = np.int8(TaskStatus.DEPLOYED)
+FAILED = np.int8(TaskStatus.FAILED)
+
+@njit(cache=True, fastmath=True)
+def _progress_tasks_kernel(status, deps_mask, first_active, stop, team_rates, dep_rolls, rolls):
+    """Resolve dependencies and promote in-progress tasks, returning how many became ready per replica
+
+    Each replica r scans its tasks in [first_active[r], stop). dep_rolls[r] and rolls[r] hold one
+    row/entry per in-progress task of that replica, consumed in index order.
+    """
+    n_promoted = np.zeros(status.shape[0], dtype=np.int64)
+    for r in range(status.shape[0]):
+        j = 0
+        for i in range(first_active[r], stop):
+            if status[r, i] != IN_PROGRESS:
+                continue
+            # Check dependencies: each team completes its part at its completion rate
+            completed_bits = 0
+            for team_idx in range(team_rates.size):
+                if dep_rolls[r, j, team_idx] < team_rates[team_idx]:
+                    completed_bits |= 1 << team_idx
+            deps_mask[r, i] &= ~np.uint32(completed_bits)
+            
+            # Only progress if no dependencies remain
+            if deps_mask[r, i] == 0 and rolls[r, j] < 0.3:
+                status[r, i] = READY_TO_DEPLOY
+                n_promoted[r] += 1
+            j += 1
+    return n_promoted
+
+@njit(cache=True, fastmath=True)
+def _attempt_deploy_kernel(status, recovery_hours, deploy_day, first_active, stop, rolls,
+                           failure_chance, recovery_time, day):
+    """Deploy every ready task, returning how many deployments failed per replica"""
+    n_failed = np.zeros(status.shape[0], dtype=np.int64)
+    for r in range(status.shape[0]):
+        j = 0
+        for i in range(first_active[r], stop):
+            if status[r, i] != READY_TO_DEPLOY:
+                continue
+            if rolls[r, j] < failure_chance:
+                status[r, i] = FAILED
+                recovery_hours[r, i] = recovery_time
+                n_failed[r] += 1
+            else:
+                status[r, i] = DEPLOYED
+                deploy_day[r, i] = day
+            j += 1
+    return n_failed
+
+@njit(cache=True)
+def _advance_first_active_kernel(status, first_active, stop):
+    """Move each replica's first_active past the tasks that are already deployed or failed"""
+    for r in range(status.shape[0]):
+        i = first_active[r]
+        while i < stop and (status[r, i] == DEPLOYED or status[r, i] == FAILED):
+            i += 1
+        first_active[r] = i
 
 SIMULATION_DEFAULTS = {
     # Team Parameters
@@ -59,189 +119,302 @@ SIMULATION_DEFAULTS = {
 }
 
 class DeploymentSimulation:
-    def __init__(self, allow_friday_deploys: bool, params: dict = None, failure_cost_multiplier: float = 1.0):
+    def __init__(self, allow_friday_deploys: bool, params: dict = None, failure_cost_multiplier: float = 1.0,
+                 seed: Optional[Union[int, np.random.SeedSequence]] = None, replicas: int = 1):
         self.params = params or SIMULATION_DEFAULTS.copy()
+        
+        # Bind params to attributes once, so hot paths avoid dict lookups
+        self._team_size = self.params['team_size']
+        self._avg_hourly_rate = self.params['avg_hourly_rate']
+        self._new_tasks_per_day = self.params['new_tasks_per_day']
+        self._task_complexity_range = self.params['task_complexity_range']
+        self._hourly_revenue = self.params['hourly_revenue']
+        self._hourly_downtime_cost = self.params['hourly_downtime_cost']
+        self._base_deploy_failure_rate = self.params['base_deploy_failure_rate']
+        self._weekend_recovery_multiplier = self.params['weekend_recovery_multiplier']
+        self._normal_recovery_hours = self.params['normal_recovery_hours']
+        self._context_switch_cost_hours = self.params['context_switch_cost_hours']
+        self._dependency_probability = self.params['dependency_probability']
+        self._other_teams = self.params['other_teams']
+        
+        if replicas < 1:
+            raise ValueError("replicas must be at least 1")
+        self.rng = np.random.default_rng(seed)
+        if len(self._other_teams) > 32:
+            raise ValueError("At most 32 other teams are supported (one deps_mask bit per team)")
+        self._team_rates = np.array([t['task_completion_rate'] for t in self._other_teams])
         self.failure_cost_multiplier = failure_cost_multiplier
         self.allow_friday_deploys = allow_friday_deploys
-        self.current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        self.tasks: List[Task] = []
+        # Independent Monte Carlo trajectories, simulated together along the first array axis
+        self.replicas = replicas
+        self.current_weekday = datetime.now().weekday()  # Monday == 0
+        
+        # Weekday-dependent rules, looked up by current_weekday instead of recomputed daily
+        base_time = self._normal_recovery_hours
+        self._recovery_hours_by_weekday = np.array([
+            base_time * self._weekend_recovery_multiplier if weekday in (4, 5, 6) else base_time  # Fri, Sat, Sun
+            for weekday in range(7)
+        ])
+        self._deploy_allowed_by_weekday = np.array([
+            allow_friday_deploys if weekday == 4 else True  # Friday
+            for weekday in range(7)
+        ], dtype=bool)
+        
+        # Costs are accumulated as int64 cents, so sums are exact and order-independent
+        recovery_cost_per_hour = (
+            self._team_size *
+            self._avg_hourly_rate *
+            failure_cost_multiplier
+        )
+        downtime_cost_per_hour = self._hourly_downtime_cost * failure_cost_multiplier
+        failure_cost_cents = np.rint(
+            100 * self._recovery_hours_by_weekday * (recovery_cost_per_hour + downtime_cost_per_hour)
+        )
+        if not np.isfinite(failure_cost_cents).all() or np.abs(failure_cost_cents).max() >= 2**63:
+            raise ValueError("Failure cost per deploy does not fit in int64 cents")
+        self._failure_cost_cents_by_weekday = failure_cost_cents.astype(np.int64)
+        self._delay_cost_cents = int(round(
+            100 *
+            self._hourly_revenue *
+            24  # Full day delay
+        ))
+        self.day = 0
         self.task_counter = 0
-        self.total_cost = 0
-        self.daily_costs = []
+        self._allocate_tasks(0)
+        self.total_cost_cents = np.zeros(replicas, dtype=np.int64)
+        self.daily_costs_cents = np.zeros((replicas, 0), dtype=np.int64)
         self.metrics = {
-            'failed_deploys': 0,
-            'successful_deploys': 0,
-            'delayed_tasks': 0,
-            'total_recovery_hours': 0
+            'failed_deploys': np.zeros(replicas, dtype=np.int64),
+            'successful_deploys': np.zeros(replicas, dtype=np.int64),
+            'delayed_tasks': np.zeros(replicas, dtype=np.int64),
+            'total_recovery_hours': np.zeros(replicas)
         }
     
+    def _allocate_tasks(self, capacity: int):
+        """Pre-allocate one slot per task and replica in parallel (replicas, capacity) arrays
+
+        Slots at or past task_counter are left uninitialized; generate_daily_tasks sets every
+        field of a slot when it creates the task, and nothing reads a slot before that.
+        """
+        shape = (self.replicas, capacity)
+        self.status = np.empty(shape, dtype=np.int8)
+        self.complexity = np.empty(shape, dtype=np.int32)
+        self.recovery_hours = np.empty(shape, dtype=np.float64)
+        self.created_day = np.empty(shape, dtype=np.int32)
+        self.deploy_day = np.empty(shape, dtype=np.int32)
+        # Bit i set means the task is still waiting on other_teams[i]
+        self.deps_mask = np.empty(shape, dtype=np.uint32)
+        # Tasks before _first_active[r] are all deployed or failed, so daily updates skip them
+        self._first_active = np.zeros(self.replicas, dtype=np.int64)
+        self.n_in_progress = np.zeros(self.replicas, dtype=np.int64)
+        self.n_ready = np.zeros(self.replicas, dtype=np.int64)
+    
+    def _reserve_days(self, days: int):
+        """Grow the task and daily cost arrays to fit `days` more days, keeping existing state"""
+        capacity = self.task_counter + days * self._new_tasks_per_day
+        n_days = self.day + days
+        if capacity <= self.status.shape[1] and n_days <= self.daily_costs_cents.shape[1]:
+            return
+        
+        # Grow at least geometrically so day-by-day callers don't reallocate every day
+        capacity = max(capacity, 2 * self.status.shape[1])
+        n_days = max(n_days, 2 * self.daily_costs_cents.shape[1])
+        
+        # Each task fails at most once and is delayed at most once per day, which bounds total_cost_cents
+        worst_case_cents = capacity * (
+            int(np.abs(self._failure_cost_cents_by_weekday).max()) + n_days * abs(self._delay_cost_cents)
+        )
+        if worst_case_cents > np.iinfo(np.int64).max:
+            raise ValueError(f"Costs over {n_days} days could overflow int64 cents")
+        
+        if capacity > self.status.shape[1]:
+            for name in ('status', 'complexity', 'recovery_hours', 'created_day', 'deploy_day', 'deps_mask'):
+                old = getattr(self, name)
+                grown = np.empty((self.replicas, capacity), dtype=old.dtype)
+                grown[:, :old.shape[1]] = old
+                setattr(self, name, grown)
+        
+        if n_days > self.daily_costs_cents.shape[1]:
+            grown = np.zeros((self.replicas, n_days), dtype=np.int64)
+            grown[:, :self.daily_costs_cents.shape[1]] = self.daily_costs_cents
+            self.daily_costs_cents = grown
+    
     def generate_daily_tasks(self):
-        for _ in range(self.params['new_tasks_per_day']):
-            self.task_counter += 1
-            complexity = random.randint(
-                self.params['task_complexity_range'][0],
-                self.params['task_complexity_range'][1]
-            )
-            
-            # Generate dependencies
-            dependencies = []
-            if random.random() < self.params['dependency_probability']:
-                team = random.choice(self.params['other_teams'])
-                dependencies.append(team['name'])
-            
-            task = Task(
-                id=self.task_counter,
-                created_date=self.current_date,
-                complexity=complexity,
-                status=TaskStatus.IN_PROGRESS,
-                dependencies=dependencies
-            )
-            self.tasks.append(task)
+        n_new = self._new_tasks_per_day
+        new = slice(self.task_counter, self.task_counter + n_new)
+        self.task_counter += n_new
+        self.n_in_progress += n_new
+        
+        shape = (self.replicas, n_new)
+        self.status[:, new] = IN_PROGRESS
+        self.complexity[:, new] = self.rng.integers(
+            self._task_complexity_range[0],
+            self._task_complexity_range[1] + 1,
+            size=shape
+        )
+        self.created_day[:, new] = self.day
+        self.deploy_day[:, new] = -1
+        self.recovery_hours[:, new] = 0
+        
+        # Generate dependencies; with no other teams there is nothing to wait on
+        if self._other_teams:
+            has_dependency = self.rng.random(shape) < self._dependency_probability
+            team_idx = self.rng.integers(0, len(self._other_teams), size=shape)
+            self.deps_mask[:, new] = np.where(has_dependency, 1 << team_idx, 0)
+        else:
+            self.deps_mask[:, new] = 0
     
     def should_deploy_today(self) -> bool:
-        if self.current_date.weekday() == 4:  # Friday
-            return self.allow_friday_deploys
-        return True
+        return bool(self._deploy_allowed_by_weekday[self.current_weekday])
     
     def calculate_deploy_risk(self) -> float:
         """Calculate probability of deployment failure"""
-        return self.params['base_deploy_failure_rate']
+        return self._base_deploy_failure_rate
     
     def calculate_recovery_time(self) -> float:
         """Calculate hours needed to recover from a failed deployment"""
-        base_time = self.params['normal_recovery_hours']
-        if self.current_date.weekday() in [4, 5, 6]:  # Fri, Sat, Sun
-            return base_time * self.params['weekend_recovery_multiplier']
-        return base_time
+        return float(self._recovery_hours_by_weekday[self.current_weekday])
     
     def attempt_deployments(self):
-        daily_cost = 0
+        daily_cost = np.zeros(self.replicas, dtype=np.int64)
         
         if not self.should_deploy_today():
             return daily_cost
         
-        ready_tasks = [t for t in self.tasks if t.status == TaskStatus.READY_TO_DEPLOY]
+        n_ready = self.n_ready
+        if not n_ready.any():
+            return daily_cost
         
-        for task in ready_tasks:
-            failure_chance = self.calculate_deploy_risk()
-            
-            if random.random() < failure_chance:
-                task.status = TaskStatus.FAILED
-                task.recovery_hours = self.calculate_recovery_time()
-                self.metrics['failed_deploys'] += 1
-                
-                # Calculate failure costs with multiplier
-                recovery_cost = (
-                    task.recovery_hours * 
-                    self.params['team_size'] * 
-                    self.params['avg_hourly_rate'] *
-                    self.failure_cost_multiplier
-                )
-                downtime_cost = (
-                    task.recovery_hours * 
-                    self.params['hourly_downtime_cost'] *
-                    self.failure_cost_multiplier
-                )
-                daily_cost += recovery_cost + downtime_cost
-                self.total_cost += recovery_cost + downtime_cost
-                self.metrics['total_recovery_hours'] += task.recovery_hours
-            else:
-                task.status = TaskStatus.DEPLOYED
-                task.deploy_date = self.current_date
-                self.metrics['successful_deploys'] += 1
+        # Every ready task either deploys or fails, so none stay ready
+        self.n_ready = np.zeros_like(n_ready)
+        recovery_hours = self.calculate_recovery_time()
+        n_failed = _attempt_deploy_kernel(
+            self.status, self.recovery_hours, self.deploy_day, self._first_active, self.task_counter,
+            self.rng.random((self.replicas, n_ready.max())), self.calculate_deploy_risk(),
+            recovery_hours, self.day
+        )
+        _advance_first_active_kernel(self.status, self._first_active, self.task_counter)
+        self.metrics['failed_deploys'] += n_failed
+        self.metrics['successful_deploys'] += n_ready - n_failed
+        
+        daily_cost += n_failed * self._failure_cost_cents_by_weekday[self.current_weekday]
+        self.total_cost_cents += daily_cost
+        self.metrics['total_recovery_hours'] += n_failed * recovery_hours
         
         return daily_cost
     
     def progress_tasks(self):
-        for task in self.tasks:
-            if task.status == TaskStatus.IN_PROGRESS:
-                # Check dependencies
-                if task.dependencies:
-                    for dep in task.dependencies:
-                        team = next(t for t in self.params['other_teams'] if t['name'] == dep)
-                        if random.random() < team['task_completion_rate']:
-                            task.dependencies.remove(dep)
-                
-                # Only progress if no dependencies remain
-                if not task.dependencies and random.random() < 0.3:
-                    task.status = TaskStatus.READY_TO_DEPLOY
+        n_in_progress = self.n_in_progress.max()
+        n_promoted = _progress_tasks_kernel(
+            self.status, self.deps_mask, self._first_active, self.task_counter, self._team_rates,
+            self.rng.random((self.replicas, n_in_progress, self._team_rates.size)),
+            self.rng.random((self.replicas, n_in_progress))
+        )
+        self.n_in_progress -= n_promoted
+        self.n_ready += n_promoted
     
     def calculate_daily_delay_cost(self):
-        daily_cost = 0
-        ready_tasks = [t for t in self.tasks if t.status == TaskStatus.READY_TO_DEPLOY]
-        if ready_tasks and not self.should_deploy_today():
-            delay_cost = (
-                len(ready_tasks) * 
-                self.params['hourly_revenue'] * 
-                24  # Full day delay
-            )
-            daily_cost += delay_cost
-            self.total_cost += delay_cost
-            self.metrics['delayed_tasks'] += len(ready_tasks)
+        daily_cost = np.zeros(self.replicas, dtype=np.int64)
+        if not self.should_deploy_today():
+            n_ready = self.n_ready
+            daily_cost += n_ready * self._delay_cost_cents
+            self.total_cost_cents += daily_cost
+            self.metrics['delayed_tasks'] += n_ready
         return daily_cost
     
     def simulate_day(self):
+        if (self.task_counter + self._new_tasks_per_day > self.status.shape[1]
+                or self.day >= self.daily_costs_cents.shape[1]):
+            self._reserve_days(1)
         self.generate_daily_tasks()
         self.progress_tasks()
         deploy_cost = self.attempt_deployments()
         delay_cost = self.calculate_daily_delay_cost()
-        self.daily_costs.append(deploy_cost + delay_cost)
-        self.current_date += timedelta(days=1)
+        self.daily_costs_cents[:, self.day] = deploy_cost + delay_cost
+        self.current_weekday = (self.current_weekday + 1) % 7
+        self.day += 1
     
     def run_simulation(self, days: int) -> Dict:
+        """Run every replica for `days` more days; costs and metrics hold one entry per replica"""
+        self._reserve_days(days)
         for _ in range(days):
             self.simulate_day()
         
         return {
-            'total_cost': self.total_cost,
-            'daily_costs': self.daily_costs,
+            'total_cost': self.total_cost_cents / 100.0,
+            'daily_costs': self.daily_costs_cents[:, :self.day] / 100.0,
             'metrics': self.metrics,
-            'allow_friday_deploys': self.allow_friday_deploys
+            'allow_friday_deploys': self.allow_friday_deploys,
+            'replicas': self.replicas
         }
 
-def compare_deployment_strategies(days: int = 90, scenarios: List[float] = [1.0, 10.0]):
+def _run_one(allow_friday_deploys: bool, failure_cost_multiplier: float, days: int,
+             seed: Optional[Union[int, np.random.SeedSequence]], replicas: int) -> Dict:
+    """Run a single simulation; a module-level function so pool workers can pickle it"""
+    sim = DeploymentSimulation(
+        allow_friday_deploys=allow_friday_deploys,
+        failure_cost_multiplier=failure_cost_multiplier,
+        seed=seed,
+        replicas=replicas
+    )
+    return sim.run_simulation(days)
+
+def _print_results(results: Dict):
+    """Print the mean and standard deviation of each result across replicas"""
+    metrics = results['metrics']
+    print(f"Total Cost: ${results['total_cost'].mean():,.2f} ± ${results['total_cost'].std():,.2f}")
+    print(f"Failed Deploys: {metrics['failed_deploys'].mean():.1f} ± {metrics['failed_deploys'].std():.1f}")
+    print(f"Successful Deploys: {metrics['successful_deploys'].mean():.1f} ± {metrics['successful_deploys'].std():.1f}")
+    print(f"Delayed Tasks: {metrics['delayed_tasks'].mean():.1f} ± {metrics['delayed_tasks'].std():.1f}")
+    print(f"Total Recovery Hours: {metrics['total_recovery_hours'].mean():.1f} ± {metrics['total_recovery_hours'].std():.1f}")
+
+def compare_deployment_strategies(days: int = 90, scenarios: List[float] = [1.0, 10.0], seed: Optional[int] = None,
+                                  replicas: int = 1):
+    # Give each scenario its own deterministic child SeedSequence of the parent seed; both
+    # strategies within a scenario start from it, though their streams diverge once their
+    # task counts (and so their draw sizes) differ
+    scenario_seeds = np.random.SeedSequence(seed).spawn(len(scenarios))
+    
+    # Every (scenario, strategy) run is independent, so run them all in parallel
+    runs = [
+        (allow_friday_deploys, failure_multiplier, days, scenario_seed, replicas)
+        for failure_multiplier, scenario_seed in zip(scenarios, scenario_seeds)
+        for allow_friday_deploys in (True, False)
+    ]
+    n_workers = min(len(runs), multiprocessing.cpu_count())
+    if n_workers <= 1:
+        # A pool would only add process startup and per-worker JIT cost
+        results = [_run_one(*run) for run in runs]
+    else:
+        with multiprocessing.Pool(n_workers) as pool:
+            results = pool.starmap(_run_one, runs)
+    
     plt.figure(figsize=(15, 10))
     
     for idx, failure_multiplier in enumerate(scenarios):
-        # Run simulations for this scenario
-        friday_sim = DeploymentSimulation(
-            allow_friday_deploys=True, 
-            failure_cost_multiplier=failure_multiplier
-        )
-        no_friday_sim = DeploymentSimulation(
-            allow_friday_deploys=False,
-            failure_cost_multiplier=failure_multiplier
-        )
-        
-        friday_results = friday_sim.run_simulation(days)
-        no_friday_results = no_friday_sim.run_simulation(days)
+        friday_results, no_friday_results = results[2 * idx], results[2 * idx + 1]
         
         # Print results for this scenario
-        print(f"\n=== Scenario {idx + 1}: Failure Cost Multiplier {failure_multiplier}x ===")
+        print(f"\n=== Scenario {idx + 1}: Failure Cost Multiplier {failure_multiplier}x ({replicas} replicas) ===")
         print("\nFriday Deployments Allowed:")
-        print(f"Total Cost: ${friday_results['total_cost']:,.2f}")
-        print(f"Failed Deploys: {friday_results['metrics']['failed_deploys']}")
-        print(f"Successful Deploys: {friday_results['metrics']['successful_deploys']}")
-        print(f"Delayed Tasks: {friday_results['metrics']['delayed_tasks']}")
-        print(f"Total Recovery Hours: {friday_results['metrics']['total_recovery_hours']:.1f}")
+        _print_results(friday_results)
         
         print("\nNo Friday Deployments:")
-        print(f"Total Cost: ${no_friday_results['total_cost']:,.2f}")
-        print(f"Failed Deploys: {no_friday_results['metrics']['failed_deploys']}")
-        print(f"Successful Deploys: {no_friday_results['metrics']['successful_deploys']}")
-        print(f"Delayed Tasks: {no_friday_results['metrics']['delayed_tasks']}")
-        print(f"Total Recovery Hours: {no_friday_results['metrics']['total_recovery_hours']:.1f}")
+        _print_results(no_friday_results)
         
         # Create subplot for this scenario
         plt.subplot(2, 1, idx + 1)
         
-        # Calculate cumulative costs
-        friday_cumulative = [sum(friday_results['daily_costs'][:i+1]) for i in range(len(friday_results['daily_costs']))]
-        no_friday_cumulative = [sum(no_friday_results['daily_costs'][:i+1]) for i in range(len(no_friday_results['daily_costs']))]
+        # Calculate cumulative costs per replica
+        friday_cumulative = np.cumsum(friday_results['daily_costs'], axis=1)
+        no_friday_cumulative = np.cumsum(no_friday_results['daily_costs'], axis=1)
         
-        # Plot cumulative costs over time
-        plt.plot(range(days), friday_cumulative, label='Friday Deploys', color='blue')
-        plt.plot(range(days), no_friday_cumulative, label='No Friday Deploys', color='red')
+        # Plot the mean cumulative cost over time, shading one standard deviation either side
+        for cumulative, label, color in ((friday_cumulative, 'Friday Deploys', 'blue'),
+                                         (no_friday_cumulative, 'No Friday Deploys', 'red')):
+            mean, std = cumulative.mean(axis=0), cumulative.std(axis=0)
+            plt.plot(range(days), mean, label=label, color=color)
+            plt.fill_between(range(days), mean - std, mean + std, color=color, alpha=0.2)
         
         plt.title(f'Cumulative Costs Over Time (Failure Cost {failure_multiplier}x)')
         plt.xlabel('Days')
@@ -256,8 +429,5 @@ def compare_deployment_strategies(days: int = 90, scenarios: List[float] = [1.0,
     plt.show()
 
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    random.seed(42)
-    
-    # Run simulation for 90 days with two scenarios
-    compare_deployment_strategies(90, [1.0, 1000.0])
\ No newline at end of file
+    # Run 100 replicas of a 90-day simulation for two scenarios, seeded for reproducibility
+    compare_deployment_strategies(90, [1.0, 1000.0], seed=42, replicas=100)